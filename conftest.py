@@ -0,0 +1 @@
+# Root conftest: makes the repository root importable (import src...) under plain `pytest`.
@@ -1,11 +1,37 @@
+import functools
+from datetime import timedelta
+import numpy as np
 import pandas as pd
 import requests_cache
 from entsoe import EntsoePandasClient
 from src.config import ENTSOE_API_TOKEN, TIMEZONE, AREA
 
+@functools.lru_cache(maxsize=None)
+def _get_client() -> EntsoePandasClient:
+    # Built once per process: reuses the SQLite cache handle and connection pool.
+    # Responses expire after a day (or per server Cache-Control); expired entries
+    # are served immediately while refreshed in the background, and kept on errors.
+    session = requests_cache.CachedSession(
+        'cache/entsoe_cache',
+        backend='sqlite',
+        expire_after=timedelta(days=1),
+        cache_control=True,
+        stale_if_error=True,
+        stale_while_revalidate=True,
+        fast_save=True,
+    )
+    return EntsoePandasClient(api_key=ENTSOE_API_TOKEN, session=session)
+
 def fetch_day_ahead_prices(start: str, end: str, area: str = AREA) -> pd.Series:
-    session = requests_cache.CachedSession('cache/entsoe_cache')
-    client = EntsoePandasClient(api_key=ENTSOE_API_KEY, session=session)
+    """
+    Fetch day-ahead prices as a float32 Series with a UTC DatetimeIndex.
+
+    The narrow dtype halves memory traffic for downstream rolling/shift
+    features, and no further numeric coercion is needed by callers.
+    """
+    client = _get_client()
     prices = client.query_day_ahead_prices(area, start=pd.Timestamp(start, tz=TIMEZONE), end=pd.Timestamp(end, tz=TIMEZONE))
+    prices = prices.astype(np.float32)
+    prices.index = prices.index.tz_convert('UTC')
     prices.name = 'DayAheadPrice'
     return prices
@@ -1,8 +1,21 @@
 import os, requests, datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
 from .config import FILE_LIBRARY_URL, DOMAIN_MAP, CONGESTION_INCOME_CATEGORY
 
+# Default number of parallel downloads / listing pages (also sizes the connection pool)
+MAX_DOWNLOAD_WORKERS = 8
+
+# Chunk size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Query parameters shared by every file-library listing
+_LIST_FILES_STATIC = (
+    ("psrType", ""),                # not needed for congestion income
+)
+
 # ------------------------------------------------------------
 # ENTSO-E File Library Client
 # Handles:
@@ -12,24 +25,34 @@ from .config import FILE_LIBRARY_URL, DOMAIN_MAP, CONGESTION_INCOME_CATEGORY
 # ------------------------------------------------------------
 
 class EntsoeClient:
-    def __init__(self, token: str):
+    def __init__(self, token: str, max_workers: int = MAX_DOWNLOAD_WORKERS):
         """
         Parameters
         ----------
         token : str
             ENTSO-E API token (stored in .env as ENTSOE_API_TOKEN)
+        max_workers : int
+            Parallel downloads / listing pages; also sizes the connection pool
         """
         self.token = token
+        self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": f"Bearer {self.token}"
         })
 
+        # One pooled connection per download worker
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+        )
+        self.session.mount("https://", adapter)
+
     # --------------------------------------------------------
     # Utility: simple GET wrapper with error-handling
     # --------------------------------------------------------
-    def _get(self, url: str, params: dict = None):
-        r = self.session.get(url, params=params)
+    def _get(self, url: str, params=None, stream: bool = False):
+        r = self.session.get(url, params=params, stream=stream)
         if not r.ok:
             raise ValueError(
                 f"ENTSO-E Request failed ({r.status_code}): {r.text[:500]}"
@@ -50,25 +73,42 @@ class EntsoeClient:
         """
         Query ENTSO-E file library for metadata for a given date range.
 
-        This returns *metadata only*, not files.
+        This returns *metadata only*, not files. `limit` is the page size;
+        if the listing spans several pages, the remaining pages are fetched
+        concurrently once the first response reports `totalPages`.
         """
-        domain = DOMAIN_MAP[bidding_zone]
-
-        params = {
-            "page": 0,
-            "size": limit,
-            "psrType": "",              # not needed for congestion income
-            "category": category,
-            "searchFrom": start,
-            "searchTo": end,
-            "area": domain,
-        }
+        domain = DOMAIN_MAP.get(bidding_zone)
+        if domain is None:
+            raise KeyError(
+                f"Unknown bidding zone '{bidding_zone}'. "
+                f"Known zones: {sorted(DOMAIN_MAP)}"
+            )
+
+        # Sequence of pairs: requests encodes it as-is, no dict to build
+        params = (
+            *_LIST_FILES_STATIC,
+            ("size", limit),
+            ("category", category),
+            ("searchFrom", start),
+            ("searchTo", end),
+            ("area", domain),
+        )
 
         url = f"{FILE_LIBRARY_URL}/v1/files"
-        r = self._get(url, params=params)
-        data = r.json()
 
-        return data.get("content", [])
+        def fetch_page(page: int) -> Dict:
+            return self._get(url, params=(("page", page), *params)).json()
+
+        data = fetch_page(0)
+        content = list(data.get("content", []))
+
+        total_pages = data.get("totalPages", 1)
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+                for page_data in ex.map(fetch_page, range(1, total_pages)):
+                    content.extend(page_data.get("content", []))
+
+        return content
 
     # --------------------------------------------------------
     # 2) Download a single file by ID
@@ -77,14 +117,23 @@ class EntsoeClient:
         """
         Downloads a file given its fileId.
         Saves raw XML/CSV into the data/raw folder.
+
+        The body is streamed in chunks to a temporary .part file, which only
+        replaces dest_path once complete; a failed download leaves no file.
         """
         url = f"{FILE_LIBRARY_URL}/v1/files/{file_id}/download"
 
-        r = self._get(url)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path.with_suffix(dest_path.suffix + ".part")
 
-        with open(dest_path, "wb") as f:
-            f.write(r.content)
+        try:
+            with self._get(url, stream=True) as r, open(part_path, "wb") as f:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(part_path, dest_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
 
         return dest_path
 
@@ -96,13 +145,21 @@ class EntsoeClient:
         bidding_zone: str,
         start: str,
         end: str,
-        raw_dir: Path
+        raw_dir: Path,
+        max_workers: Optional[int] = None
     ) -> List[Path]:
         """
         High-level helper:
         - Lists files for 12.1.E congestion income
-        - Downloads all found files
+        - Downloads all found files concurrently (shared session)
+
+        Returned paths follow the order of the file listing. max_workers
+        defaults to, and is capped at, the client's connection-pool size.
         """
+        if max_workers is None:
+            max_workers = self.max_workers
+        max_workers = min(max_workers, self.max_workers)
+
         meta = self.list_files(
             category=CONGESTION_INCOME_CATEGORY,
             start=start,
@@ -114,16 +171,19 @@ class EntsoeClient:
             print("⚠️ No files found for given period.")
             return []
 
-        saved_files = []
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = []
 
-        for m in meta:
-            file_id = m["fileId"]
-            fname = m["fileName"]
-            dest = raw_dir / fname
+            for m in meta:
+                file_id = m["fileId"]
+                fname = m["fileName"]
+                dest = raw_dir / fname
 
-            print(f"⬇️ Downloading {fname} ...")
-            saved_files.append(
-                self.download_file(file_id, dest)
-            )
+                print(f"⬇️ Downloading {fname} ...")
+                futures.append(
+                    ex.submit(self.download_file, file_id, dest)
+                )
+
+            saved_files = [f.result() for f in futures]
 
         return saved_files
@@ -16,10 +16,11 @@ Both return tidy DataFrames with:
     RevenueEUR column
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from io import StringIO, BytesIO
-import xml.etree.ElementTree as ET
+from io import BytesIO
+from lxml import etree as LET
 
 # Namespace for ENTSO-E API XML (A25)
 NAMESP = {"ns": "urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:0"}
@@ -33,6 +34,33 @@ CANDIDATE_VALUE_FIELDS = [
     "quantity_Measure_Unit.name",
 ]
 
+# Tags used to drive the streaming parser. Matching is namespace-agnostic
+# ({*}), so default, prefixed and missing namespace declarations all work.
+_TAG_SERIES = "TimeSeries"
+_TAG_PERIOD = "Period"
+_ANY_NS_TAGS = tuple(f"{{*}}{tag}" for tag in (_TAG_SERIES, _TAG_PERIOD))
+
+# Precompiled XPath evaluators (compiled once at import, evaluated by libxml2)
+_XP_START = LET.XPath("string(*[local-name()='timeInterval']/*[local-name()='start'])")
+_XP_POINTS = LET.XPath("*[local-name()='Point']")
+_XP_POS = LET.XPath("string(*[local-name()='position'])")
+_XP_VALUE_NODES = LET.XPath(
+    "*[" + " or ".join(f"local-name()='{tag}'" for tag in CANDIDATE_VALUE_FIELDS) + "]"
+)
+
+# Preference order when a <Point> carries more than one candidate field
+_VALUE_FIELD_RANK = {tag: i for i, tag in enumerate(CANDIDATE_VALUE_FIELDS)}
+
+# Spacing between consecutive <Point> positions (A25 resolution PT15M)
+_POINT_STEP = np.timedelta64(15, "m")
+
+# Row fields of the old-style Transparency XML exports → output columns
+_OLD_XML_FIELDS = {
+    "Period.start": "Start",
+    "Period.end": "End",
+    "CongestionIncome.amount": "RevenueEUR",
+}
+
 
 # ----------------------------------------------------------------------
 # Helper: extract numeric value from <Point>
@@ -41,17 +69,70 @@ def extract_point_value(pt):
     """
     Try multiple possible XML child elements to find the numeric congestion income value.
     Returns float or None.
+
+    All candidates are fetched with one XPath union; the rarely needed
+    preference ordering only kicks in when several are present.
     """
-    for tag in CANDIDATE_VALUE_FIELDS:
-        node = pt.find(f"ns:{tag}", NAMESP)
-        if node is not None and node.text not in (None, ""):
+    nodes = _XP_VALUE_NODES(pt)
+    if len(nodes) > 1:
+        nodes.sort(key=lambda node: _VALUE_FIELD_RANK[LET.QName(node).localname])
+
+    for node in nodes:
+        if node.text:
             try:
                 return float(node.text)
-            except:
+            except ValueError:
                 pass
     return None
 
 
+# ----------------------------------------------------------------------
+# Helper: vectorised timestamps/values for one <Period>
+# ----------------------------------------------------------------------
+def extract_period_arrays(period):
+    """
+    Collect the valid <Point> entries of a <Period> as NumPy arrays.
+
+    Timestamps are computed in one vectorised step from the period start and
+    point positions. They are returned as UTC datetime64 values together with
+    the period start's timezone (None if naive).
+    Returns (timestamps, values, tz), or None if the period has no start.
+    """
+    start_text = _XP_START(period)
+    if not start_text:
+        return None
+
+    period_start = pd.to_datetime(start_text)
+    tz = period_start.tz
+    if tz is not None:
+        period_start = period_start.tz_convert("UTC").tz_localize(None)
+
+    points = _XP_POINTS(period)
+
+    # Preallocate for every <Point>; trimmed to the valid entries below
+    positions = np.empty(len(points), dtype=np.int64)
+    values = np.empty(len(points), dtype=np.float64)
+    n = 0
+
+    for pt in points:
+
+        pos_text = _XP_POS(pt)
+        if not pos_text:
+            continue
+
+        value = extract_point_value(pt)
+        if value is None:
+            continue
+
+        positions[n] = int(pos_text)
+        values[n] = value
+        n += 1
+
+    timestamps = period_start.to_datetime64() + (positions[:n] - 1) * _POINT_STEP
+
+    return timestamps, values[:n], tz
+
+
 # ======================================================================
 # 1) PARSER FOR REST API XML (A25/B10)
 # ======================================================================
@@ -59,53 +140,96 @@ def parse_entsoe_api_xml(xml_bytes: bytes) -> pd.DataFrame:
     """
     Parses ENTSO-E REST API XML using <TimeSeries> → <Period> → <Point> structure.
     Returns DataFrame with Timestamp index + RevenueEUR column.
+
+    The document is streamed with iterparse, so memory stays bounded by a
+    single <Period> regardless of report size. Elements are matched by local
+    name, whatever namespace (or prefix) the document uses.
     """
 
+    # Stream the document: only one <Period> subtree is resident at a time
+    events = LET.iterparse(
+        BytesIO(xml_bytes),
+        events=("end",),
+        tag=_ANY_NS_TAGS,
+    )
+
+    n_series = 0
+    tz = None
+    ts_chunks = []
+    val_chunks = []
+
     try:
-        tree = ET.parse(BytesIO(xml_bytes))
-        root = tree.getroot()
-    except Exception as e:
+        for _, elem in events:
+
+            if LET.QName(elem).localname == _TAG_SERIES:
+                n_series += 1
+
+            else:
+                arrays = extract_period_arrays(elem)
+                if arrays is not None:
+                    timestamps, values, period_tz = arrays
+                    if tz is None:
+                        tz = period_tz
+                    ts_chunks.append(timestamps)
+                    val_chunks.append(values)
+
+            # Release the processed subtree and any already-seen siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    except LET.XMLSyntaxError as e:
         raise ValueError(f"XML parsing error: {e}")
 
-    series = root.findall(".//ns:TimeSeries", NAMESP)
-    if not series:
+    if n_series == 0:
         raise ValueError("No <TimeSeries> elements found – not valid A25 API XML")
 
-    all_rows = []
-
-    for ts in series:
-        periods = ts.findall(".//ns:Period", NAMESP)
-        for p in periods:
+    if not any(len(v) for v in val_chunks):
+        raise ValueError("No numeric values found in API XML")
 
-            start_node = p.find("ns:timeInterval/ns:start", NAMESP)
-            if start_node is None:
-                continue
+    index = pd.DatetimeIndex(np.concatenate(ts_chunks), name="Timestamp")
+    if tz is not None:
+        index = index.tz_localize("UTC")
 
-            period_start = pd.to_datetime(start_node.text)
+    df = pd.DataFrame({"RevenueEUR": np.concatenate(val_chunks)}, index=index)
+    df = df.sort_index()
+    return df
 
-            points = p.findall("ns:Point", NAMESP)
-            for pt in points:
 
-                pos_node = pt.find("ns:position", NAMESP)
-                if pos_node is None:
-                    continue
+# ----------------------------------------------------------------------
+# Helper: stream old-style Transparency XML into flat columns
+# ----------------------------------------------------------------------
+def _parse_old_xml(path: Path) -> pd.DataFrame:
+    """
+    Stream an old-style XML export, where every child of the root is one row
+    holding <Period.start>, <Period.end> and <CongestionIncome.amount>.
+    Each row is cleared once read. Returns typed Start/End/RevenueEUR columns.
+    """
+    columns = {name: [] for name in _OLD_XML_FIELDS.values()}
+    depth = 0
 
-                pos = int(pos_node.text)
-                value = extract_point_value(pt)
+    for event, elem in LET.iterparse(str(path), events=("start", "end")):
 
-                if value is None:
-                    continue
+        if event == "start":
+            depth += 1
+            continue
 
-                timestamp = period_start + pd.Timedelta(minutes=15 * (pos - 1))
+        depth -= 1
+        if depth != 1:
+            continue
 
-                all_rows.append((timestamp, value))
+        for tag, name in _OLD_XML_FIELDS.items():
+            columns[name].append(elem.findtext(f"{{*}}{tag}"))
 
-    if not all_rows:
-        raise ValueError("No numeric values found in API XML")
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
 
-    df = pd.DataFrame(all_rows, columns=["Timestamp", "RevenueEUR"])
-    df = df.set_index("Timestamp").sort_index()
-    return df
+    return pd.DataFrame({
+        "Start": pd.to_datetime(columns["Start"], errors="coerce"),
+        "End": pd.to_datetime(columns["End"], errors="coerce"),
+        "RevenueEUR": pd.to_numeric(columns["RevenueEUR"], errors="coerce"),
+    })
 
 
 # ======================================================================
@@ -124,7 +248,9 @@ def parse_congestion_income_file(path: Path) -> pd.DataFrame:
     # CSV / TXT files
     # --------------------------------------------------------
     if suffix in [".csv", ".txt"]:
-        df = pd.read_csv(path)
+        # Arrow reader infers timestamps/floats in one multithreaded pass; the
+        # result stays NumPy-backed like the XML/API branches (and NaN drops)
+        df = pd.read_csv(path, engine="pyarrow")
         df = df.rename(columns={
             "start": "Start",
             "end": "End",
@@ -137,28 +263,27 @@ def parse_congestion_income_file(path: Path) -> pd.DataFrame:
     # --------------------------------------------------------
     elif suffix == ".xml":
         try:
-            xml_text = path.read_text(encoding="utf-8")
-            df = pd.read_xml(StringIO(xml_text))
+            df = _parse_old_xml(path)
         except Exception:
             raise ValueError(f"Cannot parse XML file: {path}")
 
-        df = df.rename(columns={
-            "Period.start": "Start",
-            "Period.end": "End",
-            "CongestionIncome.amount": "RevenueEUR"
-        })
-
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
     # --------------------------------------------------------
     # Cleaning
     # --------------------------------------------------------
+    # Coerce only columns the reader could not type (malformed entries);
+    # typed ones are brought to the ns unit the XML/API branches return
     for col in ["Start", "End"]:
-        if col in df.columns:
+        if col not in df.columns:
+            continue
+        if df[col].dtype.kind == "M":
+            df[col] = df[col].dt.as_unit("ns")
+        else:
             df[col] = pd.to_datetime(df[col], errors="coerce")
 
-    if "RevenueEUR" in df.columns:
+    if "RevenueEUR" in df.columns and df["RevenueEUR"].dtype.kind not in "iuf":
         df["RevenueEUR"] = pd.to_numeric(df["RevenueEUR"], errors="coerce")
 
     df = df.dropna(subset=["Start", "RevenueEUR"])
@@ -5,13 +5,20 @@ def load_feature_dataset(path):
     """
     Load engineered feature dataset (parquet) and validate structure.
     Accepts both str and Path inputs.
+
+    Columns are Arrow-backed (zero-copy from the parquet buffers, strings
+    dictionary-encoded); the timestamp index is restored as a DatetimeIndex.
     """
     path = Path(path)
 
     if not path.exists():
         raise FileNotFoundError(f"Feature file missing: {path}")
 
-    df = pd.read_parquet(path)
+    df = pd.read_parquet(path, engine="pyarrow", dtype_backend="pyarrow")
+
+    # Arrow backend yields a timestamp[pyarrow] Index; keep pandas datetime semantics
+    if df.index.dtype.kind == "M" and not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.DatetimeIndex(df.index)
 
     # --- Required structure checks ---
     if "RevenueEUR" not in df.columns:
@@ -45,8 +52,8 @@ def build_supervised(df, horizon=1):
     if "RevenueEUR" not in df.columns:
         raise ValueError("Missing 'RevenueEUR' in dataset")
 
-    df = df.copy()
-    df["target"] = df["RevenueEUR"].shift(-horizon)
+    # assign() returns a new frame, so the caller's df is left untouched
+    df = df.assign(target=df["RevenueEUR"].shift(-horizon))
 
     # drop last incomplete rows
     df = df.dropna(subset=["target"])
@@ -71,6 +78,8 @@ def time_split(df, target="target", ratio=0.8):
     Returns
     -------
     X_train, X_test, y_train, y_test : tuple of pd.DataFrame / pd.Series
+        y_train / y_test may share memory with `df`; copy them before
+        mutating in place.
     """
 
     if target not in df.columns:
@@ -81,8 +90,9 @@ def time_split(df, target="target", ratio=0.8):
 
     split_idx = int(len(df) * ratio)
 
-    train = df.iloc[:split_idx].copy()
-    test  = df.iloc[split_idx:].copy()
+    # Positional slices; drop() below already materialises the feature frames
+    train = df.iloc[:split_idx]
+    test  = df.iloc[split_idx:]
 
     X_train = train.drop(columns=[target])
     y_train = train[target]
@@ -1,5 +1,7 @@
 import numpy as np
-from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+
+MAPE_EPS = 1e-8
 
 
 # ------------------------------------------------------------
@@ -7,7 +9,8 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error
 # ------------------------------------------------------------
 def rmse(y_true, y_pred):
     """Root Mean Square Error."""
-    return np.sqrt(mean_squared_error(y_true, y_pred))
+    diff = np.asarray(y_true, dtype=np.float64) - np.asarray(y_pred, dtype=np.float64)
+    return np.sqrt(np.mean(diff * diff))
 
 
 def mape(y_true, y_pred):
@@ -15,8 +18,7 @@ def mape(y_true, y_pred):
     Mean Absolute Percentage Error.
     Uses epsilon to avoid division by zero.
     """
-    eps = 1e-8
-    return np.mean(np.abs((y_true - y_pred) / (y_true + eps))) * 100
+    return np.mean(np.abs((y_true - y_pred) / (y_true + MAPE_EPS))) * 100
 
 
 def mase(y_true, y_pred, insample):
@@ -54,10 +56,28 @@ def evaluate(y_true, y_pred, training_series, name="Model"):
     dict
         MAE, RMSE, MAPE, MASE
     """
-    mae = mean_absolute_error(y_true, y_pred)
-    rmse_val = rmse(y_true, y_pred)
-    mape_val = mape(y_true, y_pred)
-    mase_val = mase(y_true, y_pred, training_series)
+    yt = np.asarray(y_true, dtype=np.float64)
+    yp = np.asarray(y_pred, dtype=np.float64)
+
+    if yt.shape != yp.shape:
+        raise ValueError(
+            f"y_true and y_pred have different shapes: {yt.shape} vs {yp.shape}"
+        )
+
+    # Single fused pass: the error vector is computed once and reused
+    diff = yt - yp
+    abs_diff = np.abs(diff)
+
+    mae = abs_diff.mean()
+    if np.isnan(mae):
+        raise ValueError(f"{name}: y_true or y_pred contains NaN.")
+
+    rmse_val = np.sqrt(np.mean(diff * diff))
+    mape_val = np.mean(abs_diff / np.abs(yt + MAPE_EPS)) * 100
+
+    insample = np.asarray(training_series, dtype=np.float64)
+    naive_scale = np.nanmean(np.abs(np.diff(insample)))
+    mase_val = mae / naive_scale
 
     return {
         "MAE": mae,
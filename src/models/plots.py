@@ -9,8 +9,7 @@ All functions return figure objects to allow saving or embedding in reports.
 """
 
 import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
+import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 
@@ -23,6 +22,9 @@ def plot_residuals(y_true: pd.Series, y_pred: np.ndarray):
     Plot residual distribution, residual vs predicted, and
     residual time-series.
 
+    Drawn with Matplotlib directly on NumPy arrays (no intermediate
+    DataFrames).
+
     Parameters
     ----------
     y_true : pd.Series
@@ -41,45 +43,36 @@ def plot_residuals(y_true: pd.Series, y_pred: np.ndarray):
     if len(y_true) != len(y_pred):
         raise ValueError("y_true and y_pred must have equal length.")
 
-    # Convert residuals to DataFrame for seaborn type safety
-    residuals = pd.Series((y_true - y_pred).values, index=y_true.index, name="residuals")
-    pred_series = pd.Series(y_pred, index=y_true.index, name="predicted")
+    pred = np.asarray(y_pred, dtype=np.float64)
+    residuals = np.asarray(y_true, dtype=np.float64) - pred
+    finite = residuals[np.isfinite(residuals)]
 
     fig, axes = plt.subplots(1, 3, figsize=(18, 4))
 
     # ------------------------------------------------------------
-    # 1. Residual Distribution (Histplot)
+    # 1. Residual Distribution (density histogram)
     # ------------------------------------------------------------
-    sns.histplot(
-        data=residuals.to_frame(),      # dataframe form
-        x="residuals",
-        kde=True,
-        ax=axes[0]
-    )
+    # (density needs at least one value; an empty input just draws no bars)
+    axes[0].hist(finite, bins=50, density=finite.size > 0, alpha=0.6, edgecolor="white")
     axes[0].set_title("Residual Distribution")
+    axes[0].set_xlabel("residuals")
+    axes[0].set_ylabel("Density")
 
     # ------------------------------------------------------------
     # 2. Residual vs Predicted
     # ------------------------------------------------------------
-    sns.scatterplot(
-        data=pd.concat([pred_series, residuals], axis=1),
-        x="predicted",
-        y="residuals",
-        ax=axes[1]
-    )
+    axes[1].scatter(pred, residuals, s=8, alpha=0.5)
     axes[1].set_title("Residual vs Predicted")
+    axes[1].set_xlabel("predicted")
+    axes[1].set_ylabel("residuals")
     axes[1].axhline(0, color="red", linewidth=1)
 
     # ------------------------------------------------------------
     # 3. Residual Time Series
     # ------------------------------------------------------------
-    sns.lineplot(
-        data=residuals.to_frame(),
-        x=residuals.index,
-        y="residuals",
-        ax=axes[2]
-    )
+    axes[2].plot(y_true.index.to_numpy(), residuals, linewidth=0.8)
     axes[2].set_title("Residual Time Series")
+    axes[2].set_ylabel("residuals")
     axes[2].axhline(0, color="red", linewidth=1)
 
     plt.tight_layout()
@@ -91,7 +84,7 @@ def plot_residuals(y_true: pd.Series, y_pred: np.ndarray):
 # ------------------------------------------------------------
 def plot_forecast(y_true: pd.Series, y_pred: np.ndarray):
     """
-    Plot true vs predicted series using Plotly.
+    Plot true vs predicted series using Plotly (WebGL traces).
 
     Parameters
     ----------
@@ -108,20 +101,17 @@ def plot_forecast(y_true: pd.Series, y_pred: np.ndarray):
     if len(y_true) != len(y_pred):
         raise ValueError("y_true and y_pred lengths do not match.")
 
-    fig = px.line(
-        x=y_true.index,
-        y=[y_true.values, y_pred],
-        labels={"x": "Time", "value": "Congestion Income (EUR)"},
-        title="True vs Predicted",
-    )
+    # WebGL traces: a year of 15-min points stays responsive in the browser
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=y_true.index, y=y_true.values, mode="lines", name="True"))
+    fig.add_trace(go.Scattergl(x=y_true.index, y=np.asarray(y_pred), mode="lines", name="Predicted"))
 
     fig.update_layout(
+        title="True vs Predicted",
+        xaxis_title="Time",
+        yaxis_title="Congestion Income (EUR)",
         height=400,
         legend=dict(title="Series", itemsizing="constant"),
     )
 
-    # Assign legend labels
-    fig.data[0].name = "True"
-    fig.data[1].name = "Predicted"
-
     return fig
@@ -1,46 +1,125 @@
-import json
+import asyncio
+import functools
+import hashlib
 import os
+import diskcache
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
-def generate_llm_evaluation(input_data: dict) -> str:
-    """
-    Generate a markdown forecast evaluation using a local LLM (Ollama).
-    Returns markdown text or a descriptive error message.
-    """
+# Shared HTTP session: keeps the TCP connection to the LLM server alive across
+# calls instead of reconnecting per request. Connection failures are retried.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
 
-    # ----------------------------------------------------------------------
-    # 0. Validate input keys (defensive programming)
-    # ----------------------------------------------------------------------
-    required = [
-        "rf_metrics",
-        "baseline_metrics",
-        "feature_importance",
-        "residual_statistics",
-        "time_range",
-    ]
-
-    for key in required:
-        if key not in input_data:
-            return f"[Error: Missing required key '{key}' in LLM input data]"
+# Responses are mostly prose: ask for gzip explicitly (sync and async clients)
+_HTTP_HEADERS = {"Accept-Encoding": "gzip"}
+_SESSION.headers.update(_HTTP_HEADERS)
 
-    # Convert input to well-escaped JSON for the LLM
-    MODEL_INPUT_JSON = json.dumps(input_data, indent=2)
 
-    # ----------------------------------------------------------------------
-    # 1. Load Ollama configuration
-    # ----------------------------------------------------------------------
-    OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
-    OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1:8b-instruct-q4_0")
+# Disk cache for generated evaluations, keyed by backend, server, model, prompt
+# version, token limit and input.
+# Bump _PROMPT_VERSION whenever the prompt or generation settings change.
+_PROMPT_VERSION = "v3"
+_CACHE_DIR = ".llm_cache"
+_CACHE_TTL = 7 * 86400      # seconds
+
+# Generation limits: seven bounded sections fit comfortably in ~1100 tokens,
+# and decoding stops as soon as the top-level JSON object is closed.
+DEFAULT_MAX_OUTPUT_TOKENS = 1100
+_STOP_SEQUENCES = ["\n}\n"]
+
+
+@functools.lru_cache(maxsize=None)
+def _response_cache() -> diskcache.Cache:
+    # Opened lazily so importing this module has no filesystem side effects
+    return diskcache.Cache(_CACHE_DIR)
+
+
+def _cache_key(backend: str, base_url: str, model: str, model_input_json: str,
+               max_tokens: int) -> str:
+    raw = f"{backend}::{base_url}::{model}::{_PROMPT_VERSION}::{max_tokens}::{model_input_json}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# The cache is best-effort: a disk/SQLite error means a miss (or no write),
+# never an exception out of the entry points.
+def _cache_get(key: str):
+    try:
+        return _response_cache().get(key)
+    except Exception:
+        return None
+
+
+def _cache_set(key: str, text: str):
+    try:
+        _response_cache().set(key, text, expire=_CACHE_TTL)
+    except Exception:
+        pass
+
+
+# ----------------------------------------------------------------------
+# Backend helpers: Ollama native API (default) or a vLLM OpenAI-compatible
+# server, selected with LLM_BACKEND=ollama|vllm. Both share OLLAMA_URL and
+# OLLAMA_MODEL for the base URL and model name.
+# ----------------------------------------------------------------------
+def _build_llm_request(prompt: str, backend: str, base_url: str, model: str,
+                       max_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS):
+    """Return (endpoint URL, JSON payload) for the selected backend."""
+    if backend == "vllm":
+        return f"{base_url}/v1/chat/completions", {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.25,
+            "max_tokens": max_tokens,
+            "stop": _STOP_SEQUENCES,
+        }
+
+    return f"{base_url}/api/generate", {
+        "model": model,
+        "prompt": prompt,
+        "stream": False,
+        "options": {
+            "temperature": 0.25,
+            "num_predict": max_tokens,
+            "stop": _STOP_SEQUENCES,
+        },
+    }
 
-    # ----------------------------------------------------------------------
-    # 2. Final Prompt (markdown-only output, no JSON)
-    # ----------------------------------------------------------------------
 
-    # -------------------------
-    # 2. Balanced, analytical prompt (final recommended version)
-    # -------------------------
-    prompt = f"""
+def _llm_response_text(data: dict, backend: str):
+    """
+    Extract (generated text, finish reason) from a backend JSON response.
+    The finish reason is "stop" (EOS or stop sequence) or "length" (token cap).
+    """
+    if backend == "vllm":
+        choice = data["choices"][0]
+        text, finish_reason = choice["message"]["content"], choice.get("finish_reason")
+    else:
+        text, finish_reason = data.get("response", ""), data.get("done_reason")
+
+    # The stop sequence is not echoed back: restore the closing brace it
+    # consumed. Output cut off at the token cap is left as is.
+    text = text.strip()
+    if finish_reason == "stop" and text.startswith("{") and not text.endswith("}"):
+        text += "\n}"
+    return text, finish_reason
+
+
+# ----------------------------------------------------------------------
+# Static prompt text (built once at import; only the input JSON varies)
+# ----------------------------------------------------------------------
+_PROMPT_PREAMBLE = """
 You are a senior electricity market analyst. You will receive structured forecasting
 metrics in a JSON object. Every data point you use MUST come directly from this JSON.
 
@@ -164,7 +243,7 @@ IMPORTANT RULES:
 
 The required object structure is:
 
-{{
+{
   "section_1": "text…\n\n**Hard facts:**\n- fact1\n- fact2",
   "section_2": "text…\n\n**Hard facts:**\n- fact1\n- fact2",
   "section_3": "text…\n\n**Hard facts:**\n- fact1\n- fact2",
@@ -172,12 +251,12 @@ The required object structure is:
   "section_5": "text…\n\n**Hard facts:**\n- fact1\n- fact2",
   "section_6": "text…\n\n**Hard facts:**\n- fact1\n- fact2",
   "section_7": "text…\n\n**Hard facts:**\n- fact1\n- fact2"
-}}
+}
 
 
 FALLBACK (use only if necessary):
 
-{{
+{
   "section_1": "ERROR",
   "section_2": "ERROR",
   "section_3": "ERROR",
@@ -185,76 +264,234 @@ FALLBACK (use only if necessary):
   "section_5": "ERROR",
   "section_6": "ERROR",
   "section_7": "ERROR"
-}}
+}
 
 No markdown. No extra commentary. No prose outside the JSON object.
 Do NOT write anything before the JSON.
 Do NOT write anything after the JSON.
 Output ONLY the JSON object. Exactly one object.
+"""
 
-INPUT DATA (SOURCE OF ALL FACTS):
-{MODEL_INPUT_JSON}
+_PROMPT_SUFFIX = "\nINPUT DATA (SOURCE OF ALL FACTS):\n"
 
-"""
+
+# ----------------------------------------------------------------------
+# Input validation + prompt construction (shared by sync and async entry points)
+# ----------------------------------------------------------------------
+_REQUIRED_KEYS = frozenset((
+    "rf_metrics",
+    "baseline_metrics",
+    "feature_importance",
+    "residual_statistics",
+    "time_range",
+))
+
+
+def _validate_llm_input(input_data: dict):
+    """Return an error string listing every missing required key, else None."""
+    missing = _REQUIRED_KEYS.difference(input_data)
+    if missing:
+        return f"[Error: Missing required keys {sorted(missing)} in LLM input data]"
+
+    return None
+
+
+def _dump_input(input_data: dict) -> str:
+    """Serialise the model input as indented JSON for the prompt (and cache key)."""
+    return orjson.dumps(
+        input_data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
+
+
+def _llm_config():
+    """Read (base URL, model, backend) from the environment."""
+    OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+    OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1:8b-instruct-q4_0")
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "ollama").lower()
+    return OLLAMA_URL, OLLAMA_MODEL, LLM_BACKEND
+
+
+def _build_prompt(MODEL_INPUT_JSON: str) -> str:
+    """Balanced, analytical prompt (final recommended version)."""
+    return _PROMPT_PREAMBLE + _PROMPT_SUFFIX + MODEL_INPUT_JSON + "\n\n"
+
+
+def _prewarm_request(base_url: str, model: str):
+    """
+    vLLM request that prefills only the static prompt prefix (one output token).
+    With --enable-prefix-caching the server keeps its KV blocks, so every later
+    prompt that starts with the same preamble skips that part of the prefill.
+    """
+    url, payload = _build_llm_request(_PROMPT_PREAMBLE + _PROMPT_SUFFIX, "vllm", base_url, model)
+    payload["max_tokens"] = 1
+    return url, payload
+
+
+def prewarm_prompt_cache() -> bool:
+    """
+    Seed the vLLM prefix cache with the shared prompt preamble.
+    Returns True on success; a no-op (False) for the Ollama backend.
+    """
+    OLLAMA_URL, OLLAMA_MODEL, LLM_BACKEND = _llm_config()
+    if LLM_BACKEND != "vllm":
+        return False
+
+    url, payload = _prewarm_request(OLLAMA_URL, OLLAMA_MODEL)
+    try:
+        _SESSION.post(url, json=payload, timeout=60).raise_for_status()
+        return True
+    except Exception:
+        return False
+
+
+def _finalize_llm_text(text: str) -> str:
+    """Strip the generated text and flag empty responses."""
+    text = text.strip()
+    if not text:
+        return "[LLM returned empty response — check model or prompt.]"
+    return text
+
+
+def generate_llm_evaluation(input_data: dict, use_cache: bool = True,
+                            max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS) -> str:
+    """
+    Generate a markdown forecast evaluation using a local LLM (Ollama or vLLM).
+    Returns markdown text or a descriptive error message.
+
+    Generation is capped at max_output_tokens and stops at the end of the
+    JSON object.
+
+    Successful responses are cached on disk (.llm_cache/, 7 days) per backend,
+    server, model and input, so re-running a notebook does not regenerate
+    identical reports. Pass use_cache=False to force a fresh generation.
+    """
 
     # ----------------------------------------------------------------------
-    # 3. Build payload for Ollama
+    # 0. Validate input keys (defensive programming)
     # ----------------------------------------------------------------------
-    payload = {
-        "model": OLLAMA_MODEL,
-        "prompt": prompt,
-        "stream": False,
-        "options": {
-            "temperature": 0.25,
-            "num_predict": 2000,
-        },
-    }
+    error = _validate_llm_input(input_data)
+    if error:
+        return error
+
+    # Convert input to well-escaped JSON for the LLM
+    MODEL_INPUT_JSON = _dump_input(input_data)
 
     # ----------------------------------------------------------------------
-    # 4. Query Ollama safely
+    # 1. Load LLM configuration
+    # ----------------------------------------------------------------------
+    OLLAMA_URL, OLLAMA_MODEL, LLM_BACKEND = _llm_config()
+
+    key = _cache_key(LLM_BACKEND, OLLAMA_URL, OLLAMA_MODEL, MODEL_INPUT_JSON, max_output_tokens)
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+    # ----------------------------------------------------------------------
+    # 2. Final prompt
+    # ----------------------------------------------------------------------
+    prompt = _build_prompt(MODEL_INPUT_JSON)
+
+    # ----------------------------------------------------------------------
+    # 3. Build payload for the selected backend
+    # ----------------------------------------------------------------------
+    url, payload = _build_llm_request(prompt, LLM_BACKEND, OLLAMA_URL, OLLAMA_MODEL,
+                                      max_output_tokens)
+
+    # ----------------------------------------------------------------------
+    # 4. Query the LLM safely
     # ----------------------------------------------------------------------
     try:
-        r = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        r = _SESSION.post(
+            url,
             json=payload,
             timeout=180,
         )
         r.raise_for_status()
 
-        data = r.json()
-        text = data.get("response", "").strip()
+        text, finish_reason = _llm_response_text(orjson.loads(r.content), LLM_BACKEND)
 
-        if not text:
-            return "[LLM returned empty response — check model or prompt.]"
+        # Never cache output truncated by max_output_tokens
+        if text and use_cache and finish_reason != "length":
+            _cache_set(key, text)
 
-        return text
+        return _finalize_llm_text(text)
 
     except Exception as e:
         return f"[LLM unavailable: {e}]"
 
 
-    # ----------------------------------------------------------------------
-    # 3. Call Ollama API
-    # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# Async batch API: K evaluations in ~max(latency) instead of K × latency
+# ----------------------------------------------------------------------
+async def _agenerate(client: httpx.AsyncClient, url: str, payload: dict, backend: str,
+                     cache_key: str = None) -> str:
+    """Single non-blocking LLM call; mirrors generate_llm_evaluation's error handling."""
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/v1/chat/completions",
-            json={
-                "model": OLLAMA_MODEL,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 2000,
-                "temperature": 0.2,
-            },
-            timeout=120,
-        )
-        response.raise_for_status()
-    except requests.RequestException as e:
-        return f"[Error: Ollama API request failed: {str(e)}]"
+        r = await client.post(url, json=payload, timeout=180)
+        r.raise_for_status()
+        text, finish_reason = _llm_response_text(orjson.loads(r.content), backend)
 
-    try:
-        llm_output = response.json()
-        markdown_text = llm_output["choices"][0]["message"]["content"]
-    except (KeyError, json.JSONDecodeError) as e:
-        return f"[Error: Failed to parse Ollama response: {str(e)}]"
+        if text and cache_key is not None and finish_reason != "length":
+            _cache_set(cache_key, text)
+
+        return _finalize_llm_text(text)
+
+    except Exception as e:
+        return f"[LLM unavailable: {e}]"
+
+
+async def generate_llm_evaluations_batch(inputs: list[dict], concurrency: int = 8,
+                                         use_cache: bool = True,
+                                         max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+                                         ) -> list[str]:
+    """
+    Generate evaluations for several input dicts concurrently.
+
+    At most `concurrency` requests are in flight at once. Results are returned
+    in input order, with the same text / error strings and disk cache as
+    generate_llm_evaluation. For real parallelism the server must accept
+    concurrent requests: start Ollama with OLLAMA_NUM_PARALLEL >= concurrency,
+    or use the vLLM backend (continuous batching).
 
-    return markdown_text
\ No newline at end of file
+    Usage (e.g. in a notebook): texts = await generate_llm_evaluations_batch(inputs)
+    """
+    OLLAMA_URL, OLLAMA_MODEL, LLM_BACKEND = _llm_config()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def controlled_generate(client, input_data):
+        error = _validate_llm_input(input_data)
+        if error:
+            return error
+
+        MODEL_INPUT_JSON = _dump_input(input_data)
+
+        key = None
+        if use_cache:
+            key = _cache_key(LLM_BACKEND, OLLAMA_URL, OLLAMA_MODEL, MODEL_INPUT_JSON,
+                             max_output_tokens)
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+
+        prompt = _build_prompt(MODEL_INPUT_JSON)
+        url, payload = _build_llm_request(prompt, LLM_BACKEND, OLLAMA_URL, OLLAMA_MODEL,
+                                          max_output_tokens)
+
+        async with semaphore:
+            return await _agenerate(client, url, payload, LLM_BACKEND, cache_key=key)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, headers=_HTTP_HEADERS) as client:
+        if LLM_BACKEND == "vllm":
+            # Seed the prefix cache once so the concurrent requests below all
+            # reuse the preamble's KV blocks instead of prefilling it in parallel
+            url, payload = _prewarm_request(OLLAMA_URL, OLLAMA_MODEL)
+            try:
+                await client.post(url, json=payload, timeout=60)
+            except httpx.HTTPError:
+                pass
+
+        tasks = [controlled_generate(client, input_data) for input_data in inputs]
+        return await asyncio.gather(*tasks)
@@ -1,20 +1,61 @@
 import re
 import json
+import orjson
+
+# "section_N": "<JSON string body>" pairs, used when the output is not valid JSON.
+# Compiled once. DOTALL is not needed: the only '.' follows a backslash (an escape),
+# and raw newlines inside values are already matched by the [^"\\] class.
+_SECTION_RE = re.compile(r'"section_(\d+)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+def _parse_json_object(text):
+    """
+    Fast path: decode the span from the first '{' to the last '}' with orjson.
+    Returns the section dict, or None if the output is not a valid JSON object.
+    """
+    i = text.find("{")
+    j = text.rfind("}")
+    if i < 0 or j <= i:
+        return None
+
+    try:
+        parsed = orjson.loads(text[i:j + 1])
+    except orjson.JSONDecodeError:
+        return None
+
+    if not isinstance(parsed, dict):
+        return None
+
+    return {key: value for key, value in parsed.items()
+            if key.startswith("section_") and isinstance(value, str)}
+
+
+def _unescape(content):
+    """Decode JSON string escapes (\\n, \\", ...) in a regex-captured value."""
+    try:
+        return orjson.loads(f'"{content}"')
+    except orjson.JSONDecodeError:
+        return content.replace('\\"', '"')
+
 
 def extract_sections_from_llm_output(text):
     """
     Extracts 'section_1' ... 'section_7' from imperfect JSON-like LLM output.
     Does NOT require valid JSON structure.
+
+    Well-formed output is decoded directly with orjson; the regex scan is
+    only used as a fallback for broken JSON.
     """
 
-    pattern = r'"section_(\d+)":\s*"((?:[^"\\]|\\.)*)"'
-    matches = re.findall(pattern, text, flags=re.DOTALL)
+    sections = _parse_json_object(text)
+
+    if not sections:
+        matches = _SECTION_RE.findall(text)
 
-    if not matches:
-        raise ValueError(f"Could not extract any sections.\nRaw output:\n{text}")
+        if not matches:
+            raise ValueError(f"Could not extract any sections.\nRaw output:\n{text}")
 
-    sections = {f"section_{num}": content.replace('\\"', '"')
-                for num, content in matches}
+        sections = {f"section_{num}": _unescape(content)
+                    for num, content in matches}
 
     # verify we got all required sections
     for i in range(1, 8):
@@ -4,12 +4,44 @@
 # ================================================================
 
 import json
+import hashlib
+from html import escape
 import markdown
 from pathlib import Path
 from datetime import datetime
 import plotly.io as pio
 
 
+# Rendered figure HTML keyed by a digest of the figure JSON (bounded FIFO)
+_FIG_HTML_CACHE: dict[bytes, str] = {}
+_FIG_HTML_CACHE_SIZE = 16
+
+
+def _figure_html(fig) -> str:
+    """
+    Convert a Plotly figure to an embeddable <div>, reusing the HTML of an
+    identical figure rendered earlier (batch/grid report generation).
+    """
+    key = hashlib.blake2b(
+        pio.to_json(fig, validate=False).encode(), digest_size=16
+    ).digest()
+
+    fig_html = _FIG_HTML_CACHE.get(key)
+    if fig_html is None:
+        fig_html = pio.to_html(
+            fig,
+            full_html=False,
+            include_plotlyjs="cdn", #type: ignore[arg-type]
+            validate=False,
+            config={"responsive": True},
+        )
+        if len(_FIG_HTML_CACHE) >= _FIG_HTML_CACHE_SIZE:
+            _FIG_HTML_CACHE.pop(next(iter(_FIG_HTML_CACHE)))
+        _FIG_HTML_CACHE[key] = fig_html
+
+    return fig_html
+
+
 def export_notebook1_report(
     df_api,
     fig,
@@ -74,8 +106,7 @@ def export_notebook1_report(
     # -----------------------------------------------------------
     # 3. Convert Plotly figure
     # ----------------------------------------------------------- 
-    fig_html = pio.to_html(fig, full_html=False, include_plotlyjs="cdn" #type: ignore[arg-type]
-                           )
+    fig_html = _figure_html(fig)
 
     # -----------------------------------------------------------
     # 4. Format summary metrics
@@ -103,7 +134,7 @@ def export_notebook1_report(
     html_header = f"""
     <h2>Flow-Based Congestion Income Report (DK2)</h2>
     <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-    <p><strong>Model:</strong> {model_name}</p>
+    <p><strong>Model:</strong> {escape(model_name)}</p>
     """
 
     html_template = f"""
@@ -4,6 +4,42 @@ from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 import markdown
+from jinja2 import Environment, FileSystemLoader
+
+# Report template, compiled once at import (templates/ next to this module)
+_ENV = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "templates"),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=64,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_TPL = _ENV.get_template("notebook2_report.html.j2")
+
+# Markdown renderer built once; reset() clears per-document state between reports
+_MD = markdown.Markdown(extensions=["extra", "sane_lists"], output_format="html5")
+
+# Feature-name → report group. Exact names are one dict lookup; otherwise the
+# first matching prefix wins (checked in this order).
+_EXACT_GROUPS = {
+    "hour": "Intraday Structure",
+    "day_of_week": "Intraday Structure",
+    "is_weekend": "Intraday Structure",
+    "month": "Seasonal / Structural Features",
+    "quarter": "Seasonal / Structural Features",
+    "week_of_year": "Seasonal / Structural Features",
+    "is_month_end": "Seasonal / Structural Features",
+}
+
+_PREFIX_GROUPS = (
+    ("lag_", "Lag & Memory Features"),
+    ("roll_mean", "Rolling Means"),
+    ("roll_std", "Rolling Volatility"),
+    ("roll_max", "Rolling Maxima"),
+    ("roll_min", "Rolling Minima"),
+    ("diff", "Microstructure / Momentum"),
+)
 
 def export_notebook2_report(feature_descriptions, analysis_text, corr_fig_html,
                             model_name="llama3.1:8b-instruct-q4_0",
@@ -17,124 +53,31 @@ def export_notebook2_report(feature_descriptions, analysis_text, corr_fig_html,
     report_path = output_dir / f"feature_engineering_report_{safe_stamp}.html"
 
     # Convert AI text to HTML
-    analysis_html = markdown.markdown(
-        analysis_text,
-        extensions=["extra", "sane_lists"]
-    )
+    analysis_html = _MD.reset().convert(analysis_text)
 
     # -------- GROUP FEATURES --------
     groups = defaultdict(list)
 
     for name, desc in feature_descriptions.items():
-        if name.startswith("lag_"):
-            groups["Lag & Memory Features"].append((name, desc))
-        elif name.startswith("roll_mean"):
-            groups["Rolling Means"].append((name, desc))
-        elif name.startswith("roll_std"):
-            groups["Rolling Volatility"].append((name, desc))
-        elif name.startswith("roll_max"):
-            groups["Rolling Maxima"].append((name, desc))
-        elif name.startswith("roll_min"):
-            groups["Rolling Minima"].append((name, desc))
-        elif name.startswith("diff"):
-            groups["Microstructure / Momentum"].append((name, desc))
-        elif name in ["hour", "day_of_week", "is_weekend"]:
-            groups["Intraday Structure"].append((name, desc))
-        elif name in ["month", "quarter", "week_of_year", "is_month_end"]:
-            groups["Seasonal / Structural Features"].append((name, desc))
-        else:
-            groups["Other"].append((name, desc))
-
-    # -------- HTML TEMPLATE --------
-    html = f"""
-    <html>
-    <head>
-    <meta charset="UTF-8">
-    <title>Feature Engineering Report</title>
-    <style>
-      body {{
-        font-family: "Segoe UI", Arial, sans-serif;
-        margin: 40px;
-        color: #222;
-        background-color: #fafafa;
-        line-height: 1.6;
-      }}
-      h2, h3 {{
-        color: #2a3950;
-        margin-bottom: 6px;
-      }}
-      .section {{
-        margin-bottom: 35px;
-      }}
-      .card {{
-        background: #ffffff;
-        border: 1px solid #e3e6ea;
-        border-radius: 10px;
-        padding: 20px;
-        margin-top: 20px;
-      }}
-      table {{
-        width: 100%;
-        border-collapse: collapse;
-        font-size: 0.92rem;
-        margin-top: 10px;
-      }}
-      th {{
-        background: #f0f3f7;
-        padding: 8px;
-        text-align: left;
-        border-bottom: 1px solid #d0d4d9;
-      }}
-      td {{
-        padding: 6px 8px;
-        border-bottom: 1px solid #eee;
-        vertical-align: top;
-      }}
-      code {{
-        background: #e6e8eb;
-        padding: 2px 4px;
-        border-radius: 4px;
-      }}
-    </style>
-    </head>
-
-    <body>
-
-    <h2>Feature Engineering Report</h2>
-    <p><strong>Generated:</strong> {timestamp}<br>
-    <strong>Model:</strong> {model_name}</p>
-
-    <h3>Engineered Feature Groups</h3>
-    <p>The following features were derived from the DK2 congestion income time series:</p>
-    """
-
-    # -------- INSERT FEATURE GROUP TABLES --------
-    for group, items in groups.items():
-        html += f"<div class='section card'><h3>{group}</h3>"
-        html += "<table><tr><th>Feature</th><th>Description</th></tr>"
-        for name, desc in items:
-            html += f"<tr><td><code>{name}</code></td><td>{desc}</td></tr>"
-        html += "</table></div>"
-
-    # -------- INSERT CORRELATION MATRIX --------
-    html += f"""
-    <div class="section card">
-    <h3>📊 Correlation Matrix</h3>
-    {corr_fig_html}
-    </div>
-    """
-
-    # -------- INSERT AI ANALYSIS --------
-    html += f"""
-    <div class="section card">
-    <h3>🤖 AI Feature Analysis</h3>
-    {analysis_html}
-    </div>
-
-    </body>
-    </html>
-    """
+        group = _EXACT_GROUPS.get(name) or next(
+            (label for prefix, label in _PREFIX_GROUPS if name.startswith(prefix)),
+            "Other",
+        )
+        groups[group].append((name, desc))
+
+    # -------- RENDER TEMPLATE --------
+    # Names, descriptions and the model name are autoescaped; the figure and
+    # the converted analysis are already HTML and are marked safe in the template.
+    # The output is streamed to disk chunk by chunk, never held as one string.
+    stream = _TPL.stream(
+        timestamp=timestamp,
+        model_name=model_name,
+        groups=groups,
+        corr_fig_html=corr_fig_html,
+        analysis_html=analysis_html,
+    )
 
-    report_path.write_text(html, encoding="utf-8")
+    with report_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        stream.dump(f)
     print(f"📄 Notebook 2 report saved → {report_path.resolve()}")
     return report_path
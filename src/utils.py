@@ -1,5 +1,8 @@
+import io
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 def plot_series(series: pd.Series, title: str = "Time Series Plot"):
     series.plot(title=title, figsize=(12, 4))
@@ -7,3 +10,44 @@ def plot_series(series: pd.Series, title: str = "Time Series Plot"):
     plt.ylabel(series.name)
     plt.grid(True)
     plt.show()
+
+def plot_series_batch(series_list: list, titles: list = None, ncols: int = 1):
+    """Plot several series as subplots of one figure (one figure/render for all)."""
+    n = len(series_list)
+    nrows = (n + ncols - 1) // ncols
+    fig, axes = plt.subplots(nrows, ncols, figsize=(12, 3 * nrows), squeeze=False)
+    titles = titles or [s.name for s in series_list]
+
+    for ax, s, title in zip(axes.flat, series_list, titles):
+        # Plain arrays skip pandas' plotting wrapper
+        ax.plot(s.index.values, s.values)
+        ax.set_title(title)
+        ax.set_ylabel(s.name)
+        ax.grid(True)
+
+    # Hide unused cells of the last row
+    for ax in axes.flat[n:]:
+        ax.set_visible(False)
+
+    fig.tight_layout()
+    plt.show()
+
+def plot_series_to_png(series: pd.Series, title: str = "Time Series Plot", dpi: int = 90) -> bytes:
+    """
+    Render a series to PNG bytes for reports (e.g. as a data:image/png;base64 URI).
+
+    Draws on an Agg canvas directly, without pyplot: no GUI backend is touched
+    and no figure is registered globally, so it is safe headless and in threads.
+    """
+    fig = Figure(figsize=(12, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(series.index.values, series.values)
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel(series.name)
+    ax.grid(True)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi)
+    return buf.getvalue()
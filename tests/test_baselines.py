@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.baselines import rolling_mean
+
+
+@pytest.mark.parametrize("with_missing", [False, True])
+@pytest.mark.parametrize("window", [1, 4, 24, 96])
+def test_rolling_mean_matches_pandas(window, with_missing):
+    rng = np.random.default_rng(window)
+    values = rng.normal(100, 20, size=500)
+    if with_missing:
+        values[rng.integers(0, 500, size=10)] = np.nan
+        values[[50, 300]] = [np.inf, -np.inf]
+    series = pd.Series(values, index=pd.date_range("2024-01-01", periods=500, freq="15min"))
+
+    pd.testing.assert_series_equal(
+        rolling_mean(series, window), series.rolling(window).mean()
+    )
+
+
+def test_rolling_mean_window_longer_than_series():
+    series = pd.Series([1.0, 2.0, 3.0])
+    pd.testing.assert_series_equal(rolling_mean(series, 5), series.rolling(5).mean())
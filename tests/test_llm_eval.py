@@ -0,0 +1,83 @@
+import orjson
+import pytest
+
+from src.reporting import llm_eval
+
+INPUT = {key: 1 for key in llm_eval._REQUIRED_KEYS}
+
+
+class _Response:
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+
+class _DictCache(dict):
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    store = _DictCache()
+    monkeypatch.setattr(llm_eval, "_response_cache", lambda: store)
+    monkeypatch.setenv("LLM_BACKEND", "ollama")
+    return store
+
+
+@pytest.mark.parametrize("backend, data", [
+    ("ollama", {"response": '{\n  "section_1": "x"', "done_reason": "stop"}),
+    ("vllm", {"choices": [{"message": {"content": '{\n  "section_1": "x"'},
+                           "finish_reason": "stop"}]}),
+])
+def test_stop_sequence_restores_closing_brace(backend, data):
+    text, finish_reason = llm_eval._llm_response_text(data, backend)
+    assert finish_reason == "stop"
+    assert text == '{\n  "section_1": "x"\n}'
+
+
+@pytest.mark.parametrize("backend, data", [
+    ("ollama", {"response": '{\n  "section_1": "x', "done_reason": "length"}),
+    ("vllm", {"choices": [{"message": {"content": '{\n  "section_1": "x'},
+                           "finish_reason": "length"}]}),
+])
+def test_truncated_output_is_not_patched(backend, data):
+    text, finish_reason = llm_eval._llm_response_text(data, backend)
+    assert finish_reason == "length"
+    assert text == '{\n  "section_1": "x'
+
+
+@pytest.mark.parametrize("done_reason, cached", [("stop", True), ("length", False)])
+def test_only_complete_output_is_cached(monkeypatch, cache, done_reason, cached):
+    response = _Response({"response": '{\n  "section_1": "x"', "done_reason": done_reason})
+    monkeypatch.setattr(llm_eval._SESSION, "post", lambda *a, **kw: response)
+
+    llm_eval.generate_llm_evaluation(INPUT)
+
+    assert bool(cache) is cached
+
+
+def test_cache_errors_do_not_escape(monkeypatch):
+    class _BrokenCache:
+        def get(self, key):
+            raise OSError("database is locked")
+
+        def set(self, key, value, expire=None):
+            raise OSError("database is locked")
+
+    response = _Response({"response": "text", "done_reason": "stop"})
+    monkeypatch.setattr(llm_eval, "_response_cache", lambda: _BrokenCache())
+    monkeypatch.setattr(llm_eval._SESSION, "post", lambda *a, **kw: response)
+
+    assert llm_eval.generate_llm_evaluation(INPUT) == "text"
+
+
+def test_cache_key_depends_on_backend_and_server():
+    keys = {
+        llm_eval._cache_key(backend, url, "model", "{}", 1100)
+        for backend in ("ollama", "vllm")
+        for url in ("http://localhost:11434", "http://gpu-box:8000")
+    }
+    assert len(keys) == 4
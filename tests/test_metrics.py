@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.metrics import evaluate
+
+sklearn_metrics = pytest.importorskip("sklearn.metrics")
+
+
+def _sample(seed=0, n=300):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=n, freq="15min")
+    y_true = pd.Series(rng.normal(500, 150, size=n), index=index)
+    y_pred = y_true + rng.normal(0, 40, size=n)
+    y_train = pd.Series(rng.normal(500, 150, size=2 * n))
+    return y_true, y_pred, y_train
+
+
+def test_evaluate_matches_reference_metrics():
+    y_true, y_pred, y_train = _sample()
+
+    result = evaluate(y_true, y_pred, y_train)
+
+    mae = sklearn_metrics.mean_absolute_error(y_true, y_pred)
+    expected = {
+        "MAE": mae,
+        "RMSE": np.sqrt(sklearn_metrics.mean_squared_error(y_true, y_pred)),
+        "MAPE": np.mean(np.abs((y_true - y_pred) / (y_true + 1e-8))) * 100,
+        "MASE": mae / np.mean(np.abs(y_train.diff().dropna())),
+    }
+    assert result.keys() == expected.keys()
+    for key, value in expected.items():
+        assert result[key] == pytest.approx(value, rel=1e-12), key
+
+
+def test_evaluate_accepts_numpy_predictions():
+    y_true, y_pred, y_train = _sample(seed=1)
+    assert evaluate(y_true, y_pred.to_numpy(), y_train) == pytest.approx(
+        evaluate(y_true, y_pred, y_train)
+    )
+
+
+def test_evaluate_rejects_mismatched_shapes():
+    y_true, y_pred, y_train = _sample()
+    with pytest.raises(ValueError):
+        evaluate(y_true, y_pred.iloc[:-1], y_train)
+
+
+def test_evaluate_rejects_nan_predictions():
+    y_true, y_pred, y_train = _sample()
+    y_pred.iloc[3] = np.nan
+    with pytest.raises(ValueError):
+        evaluate(y_true, y_pred, y_train)
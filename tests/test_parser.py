@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.entsoe_api.parser import parse_congestion_income_file, parse_entsoe_api_xml
+
+
+API_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument xmlns={q}urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:0{q}>
+  <mRID>test</mRID>
+  <TimeSeries>
+    <Period>
+      <timeInterval><start>2024-01-01T00:00Z</start><end>2024-01-01T00:45Z</end></timeInterval>
+      <resolution>PT15M</resolution>
+      <Point><position>1</position><quantity>10.5</quantity></Point>
+      <Point><position>2</position><price.amount>11</price.amount></Point>
+      <Point><position>3</position><quantity>12</quantity></Point>
+    </Period>
+  </TimeSeries>
+  <TimeSeries>
+    <Period>
+      <timeInterval><start>2024-01-01T00:45Z</start><end>2024-01-01T01:00Z</end></timeInterval>
+      <resolution>PT15M</resolution>
+      <Point><position>1</position><quantity>13</quantity></Point>
+      <Point><position>2</position></Point>
+    </Period>
+  </TimeSeries>
+</Publication_MarketDocument>
+"""
+
+OLD_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<CongestionIncome>
+  <Row>
+    <Period.start>2024-01-01T01:00</Period.start>
+    <Period.end>2024-01-01T02:00</Period.end>
+    <CongestionIncome.amount>200</CongestionIncome.amount>
+  </Row>
+  <Row>
+    <Period.start>2024-01-01T00:00</Period.start>
+    <Period.end>2024-01-01T01:00</Period.end>
+    <CongestionIncome.amount>100.5</CongestionIncome.amount>
+  </Row>
+  <Row>
+    <Period.start>2024-01-01T02:00</Period.start>
+    <Period.end>2024-01-01T03:00</Period.end>
+    <CongestionIncome.amount>n/a</CongestionIncome.amount>
+  </Row>
+</CongestionIncome>
+"""
+
+CSV = """start,end,revenue
+2024-01-01 00:00,2024-01-01 01:00,1.5
+2024-01-01 01:00,2024-01-01 02:00,abc
+2024-01-01 02:00,2024-01-01 03:00,3
+"""
+
+
+@pytest.mark.parametrize("quote", ['"', "'"])
+def test_parse_entsoe_api_xml(quote):
+    df = parse_entsoe_api_xml(API_XML.format(q=quote).encode("utf-8"))
+
+    expected = pd.DataFrame(
+        {"RevenueEUR": [10.5, 11.0, 12.0, 13.0]},
+        index=pd.DatetimeIndex(
+            pd.date_range("2024-01-01", periods=4, freq="15min", tz="UTC"),
+            name="Timestamp",
+        ),
+    )
+    pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+
+def test_parse_entsoe_api_xml_namespace_variants():
+    expected = parse_entsoe_api_xml(API_XML.format(q='"').encode("utf-8"))
+    ns = "urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:0"
+
+    # A comment mentioning xmlns= ahead of the root element
+    commented = API_XML.format(q='"').replace(
+        "<Publication_MarketDocument", '<!-- xmlns="urn:other" -->\n<Publication_MarketDocument', 1
+    )
+    # Prefixed instead of default namespace
+    prefixed = (
+        API_XML.format(q='"')
+        .replace(f'xmlns="{ns}"', f'xmlns:pd="{ns}"')
+        .replace("<", "<pd:").replace("<pd:/", "</pd:").replace("<pd:?", "<?")
+    )
+
+    for document in (commented, prefixed):
+        df = parse_entsoe_api_xml(document.encode("utf-8"))
+        pd.testing.assert_frame_equal(df, expected)
+
+
+def test_parse_entsoe_api_xml_without_timeseries():
+    with pytest.raises(ValueError):
+        parse_entsoe_api_xml(b"<Publication_MarketDocument/>")
+
+
+def test_parse_old_xml(tmp_path):
+    path = tmp_path / "income.xml"
+    path.write_text(OLD_XML, encoding="utf-8")
+
+    df = parse_congestion_income_file(path)
+
+    expected = pd.DataFrame({
+        "Start": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 01:00"]),
+        "End": pd.to_datetime(["2024-01-01 01:00", "2024-01-01 02:00"]),
+        "RevenueEUR": [100.5, 200.0],
+    }, index=[1, 0])
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_parse_csv_drops_malformed_rows(tmp_path):
+    path = tmp_path / "income.csv"
+    path.write_text(CSV, encoding="utf-8")
+
+    df = parse_congestion_income_file(path)
+
+    expected = pd.DataFrame({
+        "Start": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 02:00"]),
+        "End": pd.to_datetime(["2024-01-01 01:00", "2024-01-01 03:00"]),
+        "RevenueEUR": [1.5, 3.0],
+    }, index=[0, 2])
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_csv_and_xml_frames_combine(tmp_path):
+    csv_path = tmp_path / "income.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    xml_path = tmp_path / "income.xml"
+    xml_path.write_text(OLD_XML, encoding="utf-8")
+
+    combined = pd.concat([
+        parse_congestion_income_file(csv_path),
+        parse_congestion_income_file(xml_path),
+    ])
+    hourly = combined.set_index("Start")["RevenueEUR"].resample("h").sum()
+
+    assert combined["Start"].dtype == np.dtype("datetime64[ns]")
+    assert hourly.tolist() == [102.0, 200.0, 3.0]
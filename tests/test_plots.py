@@ -0,0 +1,33 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.plots import plot_residuals
+
+
+def _y_true(n):
+    return pd.Series(np.arange(n, dtype=float),
+                     index=pd.date_range("2024-01-01", periods=n, freq="15min"))
+
+
+@pytest.mark.parametrize("n", [0, 1, 20])
+def test_plot_residuals_without_finite_residuals(n):
+    fig, axes = plot_residuals(_y_true(n), np.full(n, np.nan))
+    assert len(axes) == 3
+    plt.close(fig)
+
+
+def test_plot_residuals_density_histogram():
+    y_true = _y_true(200)
+    fig, axes = plot_residuals(y_true, y_true.to_numpy() + np.sin(np.arange(200)))
+
+    heights = np.array([patch.get_height() for patch in axes[0].patches])
+    widths = np.array([patch.get_width() for patch in axes[0].patches])
+    assert len(heights) == 50
+    assert np.isclose((heights * widths).sum(), 1.0)
+    plt.close(fig)